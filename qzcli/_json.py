@@ -0,0 +1,35 @@
+"""
+JSON 编解码 - 已安装 orjson 时使用 orjson，否则回退到标准库 json
+"""
+
+from json import JSONDecodeError  # orjson.JSONDecodeError 是它的子类
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # 可选依赖：pip install orjson
+    orjson = None
+
+
+if orjson is not None:
+    def loads(data: Union[bytes, str]) -> Any:
+        """解析 JSON"""
+        return orjson.loads(data)
+    
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """序列化为 UTF-8 编码的 JSON（非字符串 key 与标准库一样转为字符串）"""
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+else:
+    import json
+    
+    def loads(data: Union[bytes, str]) -> Any:
+        """解析 JSON"""
+        return json.loads(data)
+    
+    def dumps(obj: Any, indent: bool = False) -> bytes:
+        """序列化为 UTF-8 编码的 JSON"""
+        return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False).encode("utf-8")
+
+
+__all__ = ["loads", "dumps", "JSONDecodeError"]
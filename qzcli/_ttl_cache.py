@@ -0,0 +1,58 @@
+"""
+带过期时间的 LRU 缓存装饰器
+"""
+
+import time
+import threading
+import functools
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Tuple
+
+
+def ttl_cache(maxsize: int = 128, ttl: float = 30.0) -> Callable[[Callable], Callable]:
+    """
+    类似 functools.lru_cache，但缓存项在 ttl 秒后过期（线程安全）
+    
+    只缓存成功的返回值，抛出异常的调用不会被缓存。
+    返回值按引用共享，调用方不应修改。被装饰的函数提供 cache_clear() 清空缓存。
+    
+    Args:
+        maxsize: 最多缓存的条目数，超出时淘汰最久未使用的条目
+        ttl: 缓存有效期（秒）
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        lock = threading.Lock()
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, tuple(sorted(kwargs.items()))) if kwargs else args
+            now = time.monotonic()
+            
+            with lock:
+                entry = cache.get(key)
+                if entry is not None:
+                    value, expires_at = entry
+                    if expires_at > now:
+                        cache.move_to_end(key)
+                        return value
+                    del cache[key]
+            
+            # 调用期间不持有锁，不同参数的请求可以并发
+            value = func(*args, **kwargs)
+            
+            with lock:
+                cache[key] = (value, time.monotonic() + ttl)
+                cache.move_to_end(key)
+                while len(cache) > maxsize:
+                    cache.popitem(last=False)
+            return value
+        
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+        
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    
+    return decorator
@@ -2,7 +2,7 @@
 启智平台 API 客户端
 """
 
-import requests
+from functools import cached_property
 from typing import Optional, Dict, Any, List
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -14,6 +14,15 @@ from .config import (
     clear_token_cache,
 )
 from .crypto import encrypt_password
+from ._ttl_cache import ttl_cache
+
+
+# 只读接口的进程内缓存：同一进程内相同参数的重复查询直接复用结果
+API_CACHE_SIZE = 128
+API_CACHE_TTL = 30  # 秒
+
+# 连接池大小，需不小于最大并发请求数（get_jobs_detail_bulk 最多 4 块 × 5 线程）
+HTTP_POOL_SIZE = 32
 
 
 class QzAPIError(Exception):
@@ -37,6 +46,23 @@ class QzAPI:
         
         self._token: Optional[str] = None
     
+    @cached_property
+    def _session(self):
+        """
+        共享的 requests.Session，首次发起请求时才创建
+        
+        复用同一个 Session，使并发请求共享 keep-alive 连接池和 TLS 握手；
+        requests 导入较慢，不发请求的命令无需加载
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+    
     def _get_token(self, force_refresh: bool = False) -> str:
         """获取 Access Token（带缓存）"""
         if not force_refresh and self._token:
@@ -54,7 +80,7 @@ class QzAPI:
             raise QzAPIError("未配置认证信息，请运行 qzcli init 或设置环境变量 QZCLI_USERNAME/QZCLI_PASSWORD")
         
         url = f"{self.base_url}/auth/token"
-        response = requests.post(
+        response = self._session.post(
             url,
             json={"username": self._username, "password": self._password},
             headers={"Content-Type": "application/json"},
@@ -82,7 +108,7 @@ class QzAPI:
         token = self._get_token()
         url = f"{self.base_url}{endpoint}"
         
-        response = requests.post(
+        response = self._session.post(
             url,
             json=data,
             headers={
@@ -132,6 +158,38 @@ class QzAPI:
         
         return results
     
+    def get_jobs_detail_bulk(
+        self,
+        job_ids: List[str],
+        chunk_size: int = 50,
+        max_workers: int = 4,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        分块批量查询任务详情
+        
+        OpenAPI 没有批量详情接口，这里将 job_ids 按 chunk_size 切块后并发查询，
+        单个任务失败只会记录在对应条目的 "error" 中，不影响其他任务。
+        
+        Args:
+            job_ids: 任务 ID 列表
+            chunk_size: 每块的任务数
+            max_workers: 同时处理的块数
+            
+        Returns:
+            job_id -> 任务详情（失败时为 {"error": ...}）
+        """
+        chunks = [job_ids[i:i + chunk_size] for i in range(0, len(job_ids), chunk_size)]
+        results: Dict[str, Dict[str, Any]] = {}
+        
+        if not chunks:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            for chunk_results in executor.map(self.get_jobs_detail, chunks):
+                results.update(chunk_results)
+        
+        return results
+    
     def stop_job(self, job_id: str) -> bool:
         """停止任务"""
         try:
@@ -139,12 +197,29 @@ class QzAPI:
             return True
         except QzAPIError:
             return False
+        finally:
+            self.clear_cache()
     
     def create_job(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """创建任务"""
-        result = self._request("/openapi/v1/train_job/create", config)
+        try:
+            result = self._request("/openapi/v1/train_job/create", config)
+        finally:
+            self.clear_cache()
         return result.get("data", result)
     
+    @classmethod
+    def clear_cache(cls) -> None:
+        """清空只读接口的缓存（任务状态可能已变化时调用）"""
+        for method in (
+            cls.list_workspace_tasks,
+            cls.list_jobs_with_cookie,
+            cls.list_node_dimension,
+            cls.list_task_dimension,
+            cls.list_specs,
+        ):
+            method.cache_clear()
+    
     def test_connection(self) -> bool:
         """测试连接"""
         try:
@@ -153,6 +228,7 @@ class QzAPI:
         except Exception:
             return False
     
+    @ttl_cache(maxsize=API_CACHE_SIZE, ttl=API_CACHE_TTL)
     def list_workspace_tasks(
         self, 
         workspace_id: str, 
@@ -201,7 +277,7 @@ class QzAPI:
             "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36",
         }
         
-        response = requests.post(
+        response = self._session.post(
             url,
             json=payload,
             headers=headers,
@@ -238,6 +314,7 @@ class QzAPI:
         
         return data
     
+    @ttl_cache(maxsize=API_CACHE_SIZE, ttl=API_CACHE_TTL)
     def list_jobs_with_cookie(
         self,
         workspace_id: str,
@@ -290,7 +367,7 @@ class QzAPI:
             "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36",
         }
         
-        response = requests.post(
+        response = self._session.post(
             url,
             json=payload,
             headers=headers,
@@ -389,6 +466,7 @@ class QzAPI:
             "specs": list(specs.values()),
         }
     
+    @ttl_cache(maxsize=API_CACHE_SIZE, ttl=API_CACHE_TTL)
     def list_specs(self, compute_group_id: str) -> List[Dict[str, Any]]:
         """
         获取计算组可用的规格列表（使用 OpenAPI）
@@ -402,6 +480,7 @@ class QzAPI:
         result = self._request("/openapi/v1/specs/list", {"logic_compute_group_id": compute_group_id})
         return result.get("data", {}).get("specs", [])
     
+    @ttl_cache(maxsize=API_CACHE_SIZE, ttl=API_CACHE_TTL)
     def list_node_dimension(
         self,
         workspace_id: str,
@@ -454,7 +533,7 @@ class QzAPI:
             "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36",
         }
         
-        response = requests.post(
+        response = self._session.post(
             url,
             json=payload,
             headers=headers,
@@ -480,6 +559,7 @@ class QzAPI:
         
         return result.get("data", {})
 
+    @ttl_cache(maxsize=API_CACHE_SIZE, ttl=API_CACHE_TTL)
     def list_task_dimension(
         self,
         workspace_id: str,
@@ -531,7 +611,7 @@ class QzAPI:
             "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36",
         }
         
-        response = requests.post(
+        response = self._session.post(
             url,
             json=payload,
             headers=headers,
@@ -576,6 +656,7 @@ class QzAPI:
             session cookie 字符串
         """
         import re
+        import requests
         from urllib.parse import urljoin, urlparse, parse_qs
         
         session = requests.Session()
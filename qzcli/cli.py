@@ -3,11 +3,23 @@
 qzcli - 启智平台任务管理 CLI
 """
 
+import os
 import sys
+import json
 import time
+import signal
+import selectors
+import heapq
+import bisect
 import argparse
+import operator
+import functools
+import itertools
+from collections import defaultdict
+from datetime import datetime
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Callable, Iterable, Tuple, Any
+from concurrent.futures import ThreadPoolExecutor
 
 from . import __version__
 from .config import (
@@ -18,8 +30,93 @@ from .config import (
     list_cached_workspaces, update_workspace_projects, update_workspace_compute_groups,
 )
 from .api import get_api, QzAPIError
-from .store import get_store, JobRecord
-from .display import get_display, format_duration, format_time_ago
+from .store import get_store, JobRecord, TERMINAL_STATUSES
+
+
+# 并发请求的最大线程数
+MAX_WORKERS = 8
+
+# 运行中/排队中的任务状态（小写）
+_ACTIVE = frozenset({"job_running", "job_queuing", "job_pending", "running", "queuing", "pending"})
+
+# workspace 命令中任务状态对应的图标
+_WS_STATUS_ICONS = {
+    "RUNNING": "[cyan]●[/cyan]",
+    "QUEUING": "[yellow]◌[/yellow]",
+}
+
+# GPU 使用率颜色：< 50% 红色，50%~80% 黄色，>= 80% 绿色（用 bisect 查找区间）
+_GPU_USAGE_THRESHOLDS = (50, 80)
+_GPU_USAGE_COLORS = ("red", "yellow", "green")
+
+
+def _is_active(status_lower: str) -> bool:
+    """判断任务是否处于运行中/排队中（参数为小写状态，如 JobRecord.status_lower）"""
+    return status_lower in _ACTIVE or "running" in status_lower or "queue" in status_lower
+
+
+def _is_ws_id(s: Optional[str]) -> bool:
+    """判断输入是否为工作空间 ID（ws-xxx），否则视为名称"""
+    return s is not None and len(s) > 3 and s[:3] == "ws-"
+
+
+def _is_lcg_id(s: Optional[str]) -> bool:
+    """判断输入是否为计算组 ID（lcg-xxx），否则视为名称"""
+    return s is not None and len(s) > 4 and s[:4] == "lcg-"
+
+
+def _run_parallel(
+    func: Callable[..., Any],
+    items: Iterable[tuple],
+    max_workers: int = MAX_WORKERS,
+) -> List[Tuple[tuple, Any, Optional[Exception]]]:
+    """
+    并发执行 func(*item)，按输入顺序返回结果
+    
+    Returns:
+        [(item, result, error), ...]，成功时 error 为 None
+    """
+    items = list(items)
+    if not items:
+        return []
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        futures = [executor.submit(func, *item) for item in items]
+    
+    results = []
+    for item, future in zip(items, futures):
+        try:
+            results.append((item, future.result(), None))
+        except Exception as e:
+            results.append((item, None, e))
+    return results
+
+
+def _write_plain(lines: List[str]) -> None:
+    """直接写入 stdout 并只 flush 一次（不经过 rich 标记解析），用于供脚本使用的导出行"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+
+
+def get_display():
+    """获取显示实例（延迟导入 display 模块及 rich，只在需要输出时加载）"""
+    from .display import get_display as _get_display
+    return _get_display()
+
+
+def _list_all_tasks(api, workspace_id: str, cookie: str, page_size: int = 200) -> List[dict]:
+    """分页获取工作空间的全部任务（task_dimension）"""
+    tasks = []
+    page_num = 1
+    while True:
+        data = api.list_task_dimension(workspace_id, cookie, page_num=page_num, page_size=page_size)
+        page_tasks = data.get("task_dimensions", [])
+        tasks.extend(page_tasks)
+        if len(tasks) >= data.get("total", 0) or not page_tasks:
+            break
+        page_num += 1
+    return tasks
 
 
 def cmd_init(args):
@@ -79,7 +176,7 @@ def cmd_list_cookie(args):
         workspace_ids = [(ws_id, data.get("name", "")) for ws_id, data in all_resources.items()]
     elif workspace_input:
         # 指定的工作空间
-        if workspace_input.startswith("ws-"):
+        if _is_ws_id(workspace_input):
             workspace_id = workspace_input
             ws_resources = get_workspace_resources(workspace_id)
             ws_name = ws_resources.get("name", "") if ws_resources else ""
@@ -106,57 +203,56 @@ def cmd_list_cookie(args):
     
     all_jobs = []
     
-    for workspace_id, ws_name in workspace_ids:
-        try:
-            if len(workspace_ids) > 1:
-                display.print(f"[dim]正在获取 {ws_name or workspace_id} 的任务...[/dim]")
-            else:
-                display.print(f"[dim]正在从 API 获取任务列表...[/dim]")
-            
-            result = api.list_jobs_with_cookie(
-                workspace_id, 
-                cookie, 
-                page_size=args.limit * 2 if args.running else args.limit
-            )
-            
-            jobs_data = result.get("jobs", [])
-            
-            # 转换为 JobRecord 格式
-            for job_data in jobs_data:
-                job = JobRecord.from_api_response(job_data, source="api_cookie")
-                # 添加工作空间名称
-                if ws_name:
-                    job.metadata["workspace_name"] = ws_name
-                all_jobs.append(job)
-                
-        except QzAPIError as e:
-            if "401" in str(e) or "过期" in str(e):
+    if len(workspace_ids) > 1:
+        display.print(f"[dim]正在获取 {len(workspace_ids)} 个工作空间的任务...[/dim]")
+    else:
+        display.print(f"[dim]正在从 API 获取任务列表...[/dim]")
+    
+    page_size = args.limit * 2 if args.running else args.limit
+    results = _run_parallel(
+        lambda ws_id: api.list_jobs_with_cookie(ws_id, cookie, page_size=page_size),
+        [(workspace_id,) for workspace_id, _ in workspace_ids],
+    )
+    
+    for (workspace_id, ws_name), (_, result, error) in zip(workspace_ids, results):
+        if error is not None:
+            if not isinstance(error, QzAPIError):
+                raise error
+            if "401" in str(error) or "过期" in str(error):
                 display.print_error("Cookie 已过期，请重新设置: qzcli cookie -f <cookie_file>")
                 return 1
-            display.print_warning(f"获取 {ws_name or workspace_id} 失败: {e}")
+            display.print_warning(f"获取 {ws_name or workspace_id} 失败: {error}")
             continue
+        
+        jobs_data = result.get("jobs", [])
+        
+        # 转换为 JobRecord 格式
+        for job_data in jobs_data:
+            job = JobRecord.from_api_response(job_data, source="api_cookie")
+            # 添加工作空间名称
+            if ws_name:
+                job.metadata["workspace_name"] = ws_name
+            all_jobs.append(job)
     
     if not all_jobs:
         display.print("[dim]暂无任务[/dim]")
         return 0
     
-    # 按创建时间排序
-    all_jobs.sort(key=lambda x: x.created_at or "", reverse=True)
-    
     # 过滤状态
     if args.status:
-        all_jobs = [j for j in all_jobs if args.status.lower() in j.status.lower()]
+        status_filter = args.status.lower()
+        all_jobs = [j for j in all_jobs if status_filter in j.status_lower]
     
     # 过滤运行中的任务
     if args.running:
-        active_statuses = {"job_running", "job_queuing", "job_pending", "running", "queuing", "pending"}
-        all_jobs = [
-            j for j in all_jobs
-            if j.status.lower() in active_statuses or "running" in j.status.lower() or "queue" in j.status.lower()
-        ]
+        all_jobs = [j for j in all_jobs if _is_active(j.status_lower)]
     
-    # 限制数量
-    all_jobs = all_jobs[:args.limit]
+    # 按创建时间倒序取前 limit 个（过滤后再取，无需完整排序）
+    # 单个工作空间时 API 已按创建时间倒序返回，直接截取即可
+    if len(workspace_ids) > 1:
+        all_jobs = heapq.nlargest(args.limit, all_jobs, key=lambda x: x.created_at or "")
+    else:
+        all_jobs = all_jobs[:args.limit]
     
     if not all_jobs:
         display.print("[dim]暂无符合条件的任务[/dim]")
@@ -203,28 +299,30 @@ def cmd_list(args):
         # 只更新非终态任务
         job_ids_to_update = [
             j.job_id for j in jobs
-            if j.status not in ("job_succeeded", "job_failed", "job_stopped")
+            if j.status not in TERMINAL_STATUSES
         ]
         
         if job_ids_to_update:
             try:
-                results = api.get_jobs_detail(job_ids_to_update)
-                for job_id, data in results.items():
-                    if "error" not in data:
-                        store.update_from_api(job_id, data)
+                results = api.get_jobs_detail_bulk(job_ids_to_update)
+                updated = store.update_from_api_bulk(results)
+                # 原地替换已更新的记录，无需重新读取整个存储
+                for idx, job in enumerate(jobs):
+                    if job.job_id in updated:
+                        jobs[idx] = updated[job.job_id]
             except QzAPIError as e:
                 display.print_warning(f"部分任务状态更新失败: {e}")
         
-        # 重新获取更新后的列表
-        jobs = store.list(limit=fetch_limit, status=args.status)
+        # 状态可能已变化，重新应用状态过滤
+        if args.status:
+            jobs = [j for j in jobs if j.status == args.status]
+        
+        # created_at 可能被刷新补全或改变，按创建时间倒序重新排序（与 store.list 一致）
+        jobs.sort(key=lambda x: x.created_at or "", reverse=True)
     
     # 过滤：只显示运行中/排队中的任务
     if args.running:
-        active_statuses = {"job_running", "job_queuing", "job_pending", "running", "queuing", "pending"}
-        jobs = [
-            j for j in jobs
-            if j.status.lower() in active_statuses or "running" in j.status.lower() or "queue" in j.status.lower()
-        ]
+        jobs = [j for j in jobs if _is_active(j.status_lower)]
         # 应用 limit
         jobs = jobs[:args.limit]
         
@@ -254,7 +352,6 @@ def cmd_status(args):
         display.print_job_detail(job, api_data)
         
         if args.json:
-            import json
             print(json.dumps(api_data, indent=2, ensure_ascii=False))
         
         return 0
@@ -292,8 +389,61 @@ def cmd_stop(args):
         return 1
 
 
+# 无活跃任务时监控轮询间隔的上限（秒）
+WATCH_MAX_INTERVAL = 30
+
+
+class _ResizeWaiter:
+    """可被终端尺寸变化（SIGWINCH）提前唤醒的等待器"""
+    
+    def __init__(self):
+        self.resized = False
+        self._selector = None
+    
+    def __enter__(self) -> "_ResizeWaiter":
+        # Windows 没有 SIGWINCH，且 select 不支持管道，退化为普通 sleep
+        if not hasattr(signal, "SIGWINCH"):
+            return self
+        
+        self._rfd, self._wfd = os.pipe()
+        os.set_blocking(self._rfd, False)
+        os.set_blocking(self._wfd, False)
+        # 信号到达时由解释器向管道写入一个字节，唤醒 select
+        self._old_wakeup_fd = signal.set_wakeup_fd(self._wfd)
+        self._old_handler = signal.signal(signal.SIGWINCH, self._on_resize)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self._rfd, selectors.EVENT_READ)
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        if self._selector is None:
+            return
+        signal.signal(signal.SIGWINCH, self._old_handler)
+        signal.set_wakeup_fd(self._old_wakeup_fd)
+        self._selector.close()
+        os.close(self._rfd)
+        os.close(self._wfd)
+    
+    def _on_resize(self, signum, frame) -> None:
+        self.resized = True
+    
+    def wait(self, timeout: float) -> None:
+        """等待 timeout 秒，收到信号时提前返回"""
+        if self._selector is None:
+            time.sleep(timeout)
+            return
+        if self._selector.select(timeout):
+            try:
+                while os.read(self._rfd, 512):
+                    pass
+            except BlockingIOError:
+                pass
+
+
 def cmd_watch(args):
     """实时监控任务状态"""
+    from .display import format_duration, format_time_ago
+    
     display = get_display()
     store = get_store()
     api = get_api()
@@ -303,46 +453,62 @@ def cmd_watch(args):
     display.print(f"[bold]实时监控模式[/bold] (每 {interval} 秒刷新，按 Ctrl+C 退出)")
     display.print("")
     
+    jobs = []
+    active_count = 0
+    last_digest = None
+    poll_interval = interval
+    next_refresh = 0.0
+    
     try:
-        while True:
-            # 获取所有非终态任务
-            jobs = store.list()
-            active_jobs = [
-                j for j in jobs
-                if j.status not in ("job_succeeded", "job_failed", "job_stopped")
-            ]
-            
-            # 更新状态
-            if active_jobs:
-                job_ids = [j.job_id for j in active_jobs]
-                try:
-                    results = api.get_jobs_detail(job_ids)
-                    for job_id, data in results.items():
-                        if "error" not in data:
-                            store.update_from_api(job_id, data)
-                except QzAPIError:
-                    pass
-            
-            # 清屏并显示
-            print("\033[2J\033[H", end="")  # 清屏
-            
-            jobs = store.list(limit=args.limit)
-            display.print_jobs_table(
-                jobs,
-                title=f"启智平台任务监控 (每 {interval}s 刷新)"
-            )
-            
-            # 检查是否还有活跃任务
-            active_count = sum(
-                1 for j in jobs
-                if j.status not in ("job_succeeded", "job_failed", "job_stopped")
-            )
-            
-            if active_count == 0 and not args.keep_alive:
-                display.print("\n[green]所有任务已完成[/green]")
-                break
-            
-            time.sleep(interval)
+        with _ResizeWaiter() as waiter:
+            while True:
+                refreshed = time.monotonic() >= next_refresh
+                if refreshed:
+                    # 更新所有非终态任务的状态
+                    job_ids = store.list_active_ids()
+                    if job_ids:
+                        try:
+                            results = api.get_jobs_detail_bulk(job_ids)
+                            store.update_from_api_bulk(results)
+                        except QzAPIError:
+                            pass
+                    
+                    # 一次排序扫描同时得到显示列表和活跃任务数
+                    jobs, active_count = store.list_with_counts(limit=args.limit)
+                    
+                    # 无活跃任务且继续监控（--keep-alive）时指数退避，有活跃任务时恢复正常间隔
+                    if active_count == 0 and args.keep_alive:
+                        poll_interval = min(poll_interval * 2, max(interval, WATCH_MAX_INTERVAL))
+                    else:
+                        poll_interval = interval
+                    next_refresh = time.monotonic() + poll_interval
+                
+                # 按表格中实际显示的内容比较，画面不会变化且终端尺寸未变时不重绘
+                title = f"启智平台任务监控 (每 {poll_interval}s 刷新)"
+                digest = [title] + [
+                    (
+                        j.job_id,
+                        j.name,
+                        j.status,
+                        format_time_ago(j.created_at),
+                        format_duration(j.running_time_ms),
+                        j.finished_at,
+                    )
+                    for j in jobs
+                ]
+                if digest != last_digest or waiter.resized:
+                    waiter.resized = False
+                    last_digest = digest
+                    
+                    # 清屏并显示
+                    print("\033[2J\033[H", end="")  # 清屏
+                    display.print_jobs_table(jobs, title=title)
+                
+                if refreshed and active_count == 0 and not args.keep_alive:
+                    display.print("\n[green]所有任务已完成[/green]")
+                    break
+                
+                waiter.wait(max(0.0, next_refresh - time.monotonic()))
     
     except KeyboardInterrupt:
         display.print("\n[dim]监控已停止[/dim]")
@@ -352,7 +518,6 @@ def cmd_watch(args):
 
 def cmd_track(args):
     """追踪任务（供脚本调用）"""
-    display = get_display()
     store = get_store()
     api = get_api()
     
@@ -381,8 +546,9 @@ def cmd_track(args):
     
     store.add(job)
     
+    # 静默模式不加载 display / rich
     if not args.quiet:
-        display.print_success(f"已追踪任务: {job_id}")
+        get_display().print_success(f"已追踪任务: {job_id}")
     
     return 0
 
@@ -409,13 +575,9 @@ def cmd_import(args):
         
         if job_ids:
             try:
-                results = api.get_jobs_detail(job_ids[:50])  # 最多更新 50 个
-                updated = 0
-                for job_id, data in results.items():
-                    if "error" not in data:
-                        store.update_from_api(job_id, data)
-                        updated += 1
-                display.print_success(f"已更新 {updated} 个任务状态")
+                results = api.get_jobs_detail_bulk(job_ids)
+                updated = store.update_from_api_bulk(results)
+                display.print_success(f"已更新 {len(updated)} 个任务状态")
             except QzAPIError as e:
                 display.print_warning(f"状态更新失败: {e}")
     
@@ -493,13 +655,11 @@ def cmd_cookie(args):
             display.print_error(f"文件不存在: {filepath}")
             return 1
         with open(filepath, "r") as f:
-            lines = f.readlines()
-            # 取最后一个非空行作为 cookie
-            for line in reversed(lines):
+            # 取最后一个非空行作为 cookie（逐行扫描，不读入整个文件）
+            for line in f:
                 line = line.strip()
                 if line and not line.startswith("#") and line != "cookie":
                     cookie = line
-                    break
         if not cookie:
             display.print_error("文件中未找到有效的 cookie")
             return 1
@@ -543,21 +703,22 @@ def cmd_workspaces(args):
             display.print("[dim]暂无已缓存的工作空间，使用 qzcli res -w <workspace_id> 添加[/dim]")
             return 0
         
-        display.print(f"\n[bold]已缓存的工作空间 ({len(cached)} 个)[/bold]\n")
-        for ws in cached:
-            name = ws.get("name") or "[未命名]"
-            import datetime
-            updated = datetime.datetime.fromtimestamp(ws.get("updated_at", 0)).strftime("%Y-%m-%d %H:%M")
-            display.print(f"  [bold]{name}[/bold]")
-            display.print(f"    ID: [cyan]{ws['id']}[/cyan]")
-            display.print(f"    资源: {ws['project_count']} 项目, {ws['compute_group_count']} 计算组, {ws['spec_count']} 规格")
-            display.print(f"    更新: {updated}")
-            display.print("")
-        
-        display.print("[dim]使用方法:[/dim]")
-        display.print("  qzcli res -w <名称或ID>      # 查看资源")
-        display.print("  qzcli res -w <ID> -u         # 更新缓存")
-        display.print("  qzcli res -w <ID> --name 别名  # 设置名称")
+        fromtimestamp = datetime.fromtimestamp
+        with display.batched() as out:
+            out.print(f"\n[bold]已缓存的工作空间 ({len(cached)} 个)[/bold]\n")
+            for ws in cached:
+                name = ws.get("name") or "[未命名]"
+                updated = fromtimestamp(ws.get("updated_at", 0)).strftime("%Y-%m-%d %H:%M")
+                out.print(f"  [bold]{name}[/bold]")
+                out.print(f"    ID: [cyan]{ws['id']}[/cyan]")
+                out.print(f"    资源: {ws['project_count']} 项目, {ws['compute_group_count']} 计算组, {ws['spec_count']} 规格")
+                out.print(f"    更新: {updated}")
+                out.print("")
+            
+            out.print("[dim]使用方法:[/dim]")
+            out.print("  qzcli res -w <名称或ID>      # 查看资源")
+            out.print("  qzcli res -w <ID> -u         # 更新缓存")
+            out.print("  qzcli res -w <ID> --name 别名  # 设置名称")
         return 0
     
     # 如果只设置名称（没有 -u 参数）
@@ -579,7 +740,7 @@ def cmd_workspaces(args):
     
     if not workspace_input:
         workspace_id = cookie_data.get("workspace_id", "") if cookie_data else ""
-    elif workspace_input.startswith("ws-"):
+    elif _is_ws_id(workspace_input):
         workspace_id = workspace_input
     else:
         # 尝试通过名称查找
@@ -602,8 +763,7 @@ def cmd_workspaces(args):
     
     if use_cache:
         # 使用缓存
-        import datetime
-        updated = datetime.datetime.fromtimestamp(cached_resources.get("updated_at", 0)).strftime("%Y-%m-%d %H:%M")
+        updated = datetime.fromtimestamp(cached_resources.get("updated_at", 0)).strftime("%Y-%m-%d %H:%M")
         ws_name = cached_resources.get("name", "")
         title = f"资源配置"
         if ws_name:
@@ -613,10 +773,10 @@ def cmd_workspaces(args):
         display.print(f"\n[bold]{title}[/bold]")
         display.print(f"[dim]工作空间: {workspace_id}[/dim]\n")
         
-        # 转换缓存格式为列表格式
-        projects = list(cached_resources.get("projects", {}).values())
-        compute_groups = list(cached_resources.get("compute_groups", {}).values())
-        specs = list(cached_resources.get("specs", {}).values())
+        # 直接使用缓存字典的 values 视图，无需复制为列表
+        projects = cached_resources.get("projects", {}).values()
+        compute_groups = cached_resources.get("compute_groups", {}).values()
+        specs = cached_resources.get("specs", {}).values()
     else:
         # 从 API 获取
         if not cookie_data or not cookie_data.get("cookie"):
@@ -660,53 +820,58 @@ def cmd_workspaces(args):
                 display.print_error(f"获取失败: {e}")
             return 1
     
-    # 显示项目
-    if projects:
-        display.print(f"[bold]项目 ({len(projects)} 个)[/bold]")
-        for proj in projects:
-            display.print(f"  - {proj['name']}")
-            display.print(f"    [cyan]{proj['id']}[/cyan]")
-        display.print("")
-    
-    # 显示计算组
-    if compute_groups:
-        display.print(f"[bold]计算组 ({len(compute_groups)} 个)[/bold]")
-        for group in compute_groups:
-            gpu_type = group.get("gpu_type", "")
-            gpu_display = group.get("gpu_type_display", "")
-            display.print(f"  - {group['name']} [{gpu_type}]")
-            if gpu_display:
-                display.print(f"    [dim]{gpu_display}[/dim]")
-            display.print(f"    [cyan]{group['id']}[/cyan]")
-        display.print("")
-    
-    # 显示规格
-    if specs:
-        display.print(f"[bold]GPU 规格 ({len(specs)} 个)[/bold]")
-        for spec in specs:
-            gpu_type = spec.get("gpu_type", "")
-            gpu_count = spec.get("gpu_count", 0)
-            cpu_count = spec.get("cpu_count", 0)
-            mem_gb = spec.get("memory_gb", 0)
-            display.print(f"  - {gpu_count}x {gpu_type} + {cpu_count}核CPU + {mem_gb}GB内存")
-            display.print(f"    [cyan]{spec['id']}[/cyan]")
-        display.print("")
+    export_lines = []  # 导出行在 rich 输出之后直接写入 stdout
     
-    # 导出格式
-    if args.export:
-        display.print("[bold]导出格式（可用于 shell 脚本）:[/bold]")
-        display.print(f'WORKSPACE_ID="{workspace_id}"')
+    with display.batched() as out:
+        # 显示项目
         if projects:
-            display.print(f'PROJECT_ID="{projects[0]["id"]}"  # {projects[0]["name"]}')
+            out.print(f"[bold]项目 ({len(projects)} 个)[/bold]")
+            for proj in projects:
+                out.print(f"  - {proj['name']}")
+                out.print(f"    [cyan]{proj['id']}[/cyan]")
+            out.print("")
+        
+        # 显示计算组
         if compute_groups:
+            out.print(f"[bold]计算组 ({len(compute_groups)} 个)[/bold]")
             for group in compute_groups:
-                display.print(f'# {group["name"]} [{group.get("gpu_type", "")}]')
-                display.print(f'LOGIC_COMPUTE_GROUP_ID="{group["id"]}"')
+                gpu_type = group.get("gpu_type", "")
+                gpu_display = group.get("gpu_type_display", "")
+                out.print(f"  - {group['name']} [{gpu_type}]")
+                if gpu_display:
+                    out.print(f"    [dim]{gpu_display}[/dim]")
+                out.print(f"    [cyan]{group['id']}[/cyan]")
+            out.print("")
+        
+        # 显示规格
         if specs:
+            out.print(f"[bold]GPU 规格 ({len(specs)} 个)[/bold]")
             for spec in specs:
-                display.print(f'# {spec.get("gpu_count", 0)}x {spec.get("gpu_type", "")}')
-                display.print(f'SPEC_ID="{spec["id"]}"')
+                gpu_type = spec.get("gpu_type", "")
+                gpu_count = spec.get("gpu_count", 0)
+                cpu_count = spec.get("cpu_count", 0)
+                mem_gb = spec.get("memory_gb", 0)
+                out.print(f"  - {gpu_count}x {gpu_type} + {cpu_count}核CPU + {mem_gb}GB内存")
+                out.print(f"    [cyan]{spec['id']}[/cyan]")
+            out.print("")
+        
+        # 导出格式
+        if args.export:
+            out.print("[bold]导出格式（可用于 shell 脚本）:[/bold]")
+            export_lines.append(f'WORKSPACE_ID="{workspace_id}"')
+            first_project = next(iter(projects), None)
+            if first_project:
+                export_lines.append(f'PROJECT_ID="{first_project["id"]}"  # {first_project["name"]}')
+            if compute_groups:
+                for group in compute_groups:
+                    export_lines.append(f'# {group["name"]} [{group.get("gpu_type", "")}]')
+                    export_lines.append(f'LOGIC_COMPUTE_GROUP_ID="{group["id"]}"')
+            if specs:
+                for spec in specs:
+                    export_lines.append(f'# {spec.get("gpu_count", 0)}x {spec.get("gpu_type", "")}')
+                    export_lines.append(f'SPEC_ID="{spec["id"]}"')
     
+    _write_plain(export_lines)
     return 0
 
 
@@ -716,6 +881,12 @@ def cmd_resources(args):
     return cmd_workspaces(args)
 
 
+def _avail_rank(result: dict) -> tuple:
+    """计算组推荐排序键：(空闲节点 + 低优空余节点, 空闲节点)"""
+    free_nodes = result["free_nodes"]
+    return (free_nodes + result.get("low_priority_free_nodes", 0), free_nodes)
+
+
 def cmd_avail(args):
     """查询计算组空余节点，帮助决定任务应该提交到哪里"""
     display = get_display()
@@ -740,7 +911,7 @@ def cmd_avail(args):
             display.print("[dim]请先运行: qzcli res -w <workspace_id> -u[/dim]")
             return 1
         workspace_ids = list(all_resources.keys())
-    elif workspace_input.startswith("ws-"):
+    elif _is_ws_id(workspace_input):
         workspace_ids = [workspace_input]
     else:
         workspace_id = find_workspace_by_name(workspace_input)
@@ -756,7 +927,8 @@ def cmd_avail(args):
     group_filter = args.group
     all_results = []  # 所有工作空间的结果汇总
     
-    from collections import defaultdict
+    # 待查询的工作空间: (workspace_id, ws_name, compute_groups, specs)
+    ws_queries = []
     
     for workspace_id in workspace_ids:
         # 获取计算组列表（从缓存）
@@ -771,7 +943,7 @@ def cmd_avail(args):
         
         # 如果指定了特定计算组
         if group_filter:
-            if group_filter.startswith("lcg-"):
+            if _is_lcg_id(group_filter):
                 if group_filter in compute_groups:
                     compute_groups = {group_filter: compute_groups[group_filter]}
                 else:
@@ -787,122 +959,136 @@ def cmd_avail(args):
             continue
         
         display.print(f"[dim]正在查询 {ws_name} 的 {len(compute_groups)} 个计算组...[/dim]")
+        ws_queries.append((workspace_id, ws_name, compute_groups, specs))
+    
+    # 待查询的计算组: (workspace_id, ws_name, lcg_id, lcg_info, specs)
+    group_queries = [
+        (workspace_id, ws_name, lcg_id, lcg_info, specs)
+        for workspace_id, ws_name, compute_groups, specs in ws_queries
+        for lcg_id, lcg_info in compute_groups.items()
+    ]
+    
+    # 任务数据（用于统计低优任务占用的节点）和各计算组的节点信息互不依赖，
+    # 放进同一个线程池并发请求
+    def run_query(workspace_id, lcg_id=None):
+        if lcg_id is None:
+            return _list_all_tasks(api, workspace_id, cookie)
+        return api.list_node_dimension(workspace_id, cookie, lcg_id, page_size=1000)
+    
+    results = _run_parallel(
+        run_query,
+        [(q[0],) for q in ws_queries] + [(q[0], q[2]) for q in group_queries],
+    )
+    task_results, node_results = results[:len(ws_queries)], results[len(ws_queries):]
+    
+    low_priority_threshold = 3  # 优先级 <= 3 为低优任务
+    low_priority_by_ws = {}  # workspace_id -> {node_name: low_priority_gpu_count}
+    
+    for (workspace_id,), tasks, error in task_results:
+        node_low_priority_gpu = defaultdict(int)
+        low_priority_by_ws[workspace_id] = node_low_priority_gpu
         
-        # 获取任务数据，用于统计低优任务占用的节点
-        node_low_priority_gpu = defaultdict(int)  # node_name -> low_priority_gpu_count
-        low_priority_threshold = 3  # 优先级 <= 3 为低优任务
+        if error is not None:
+            if not isinstance(error, QzAPIError):
+                raise error
+            continue  # 获取任务数据失败不影响主要功能
         
-        try:
-            # 分页获取所有任务
-            tasks = []
-            page_num = 1
-            while True:
-                task_data = api.list_task_dimension(workspace_id, cookie, page_num=page_num, page_size=200)
-                page_tasks = task_data.get("task_dimensions", [])
-                tasks.extend(page_tasks)
-                if len(tasks) >= task_data.get("total", 0) or not page_tasks:
-                    break
-                page_num += 1
-            
-            # 统计每个节点上低优任务占用的 GPU 数
-            for task in tasks:
-                priority = task.get("priority", 10)
-                if priority <= low_priority_threshold:
-                    gpu_total = task.get("gpu", {}).get("total", 0)
-                    nodes_occupied = task.get("nodes_occupied", {}).get("nodes", [])
-                    # 平均分配 GPU 到各节点（多节点任务）
-                    gpu_per_node = gpu_total // len(nodes_occupied) if nodes_occupied else 0
-                    for node_name in nodes_occupied:
-                        node_low_priority_gpu[node_name] += gpu_per_node if len(nodes_occupied) > 1 else gpu_total
-        except QzAPIError:
-            pass  # 获取任务数据失败不影响主要功能
+        # 统计每个节点上低优任务占用的 GPU 数
+        for task in tasks:
+            priority = task.get("priority", 10)
+            if priority <= low_priority_threshold:
+                gpu_total = task.get("gpu", {}).get("total", 0)
+                nodes_occupied = task.get("nodes_occupied", {}).get("nodes", [])
+                # 平均分配 GPU 到各节点（多节点任务）
+                gpu_per_node = gpu_total // len(nodes_occupied) if nodes_occupied else 0
+                for node_name in nodes_occupied:
+                    node_low_priority_gpu[node_name] += gpu_per_node if len(nodes_occupied) > 1 else gpu_total
+    
+    for query, (_, data, error) in zip(group_queries, node_results):
+        workspace_id, ws_name, lcg_id, lcg_info, specs = query
+        node_low_priority_gpu = low_priority_by_ws[workspace_id]
+        lcg_name = lcg_info.get("name", lcg_id)
+        gpu_type = lcg_info.get("gpu_type", "")
         
-        try:
-            for lcg_id, lcg_info in compute_groups.items():
-                lcg_name = lcg_info.get("name", lcg_id)
-                gpu_type = lcg_info.get("gpu_type", "")
+        if error is not None:
+            if not isinstance(error, QzAPIError):
+                raise error
+            display.print_warning(f"查询 {lcg_name} 失败: {error}")
+            continue
+        
+        nodes = data.get("node_dimensions", [])
+        total_nodes = len(nodes)
+        
+        # 统计空闲节点（GPU 使用数为 0）和空闲 GPU 分布
+        free_count = 0
+        free_nodes = [] if args.verbose else None  # 节点明细只在 -v 时需要
+        low_priority_free_nodes = []  # 低优空余节点
+        gpu_free_distribution = {}  # free_gpu_count -> node_count
+        total_free_gpus = 0
+        total_gpus = 0
+        
+        for node in nodes:
+            node_name = node.get("name", "")
+            node_status = node.get("status", "")
+            cordon_type = node.get("cordon_type", "")
+            gpu_info = node.get("gpu", {})
+            gpu_used = gpu_info.get("used", 0)
+            gpu_total = gpu_info.get("total", 0)
+            
+            # 跳过异常节点（gpu_total=0 但有任务在跑，可能是故障节点）
+            if gpu_total == 0:
+                continue
+            
+            # 判断节点是否可调度
+            # - 状态必须是 Ready
+            # - 不能有 cordon 标记（hardware-fault, software-fault 等）
+            is_schedulable = (node_status == "Ready" and not cordon_type)
+            
+            gpu_free = max(0, gpu_total - gpu_used)  # 避免负数
+            
+            total_gpus += gpu_total
+            
+            # 只有可调度节点的空闲 GPU 才计入统计
+            if is_schedulable:
+                total_free_gpus += gpu_free
                 
-                try:
-                    data = api.list_node_dimension(workspace_id, cookie, lcg_id, page_size=1000)
-                    nodes = data.get("node_dimensions", [])
-                    total_nodes = len(nodes)
-                    
-                    # 统计空闲节点（GPU 使用数为 0）和空闲 GPU 分布
-                    free_nodes = []
-                    low_priority_free_nodes = []  # 低优空余节点
-                    gpu_free_distribution = {}  # free_gpu_count -> node_count
-                    total_free_gpus = 0
-                    total_gpus = 0
-                    
-                    for node in nodes:
-                        node_name = node.get("name", "")
-                        node_status = node.get("status", "")
-                        cordon_type = node.get("cordon_type", "")
-                        gpu_info = node.get("gpu", {})
-                        gpu_used = gpu_info.get("used", 0)
-                        gpu_total = gpu_info.get("total", 0)
-                        
-                        # 跳过异常节点（gpu_total=0 但有任务在跑，可能是故障节点）
-                        if gpu_total == 0:
-                            continue
-                        
-                        # 判断节点是否可调度
-                        # - 状态必须是 Ready
-                        # - 不能有 cordon 标记（hardware-fault, software-fault 等）
-                        is_schedulable = (node_status == "Ready" and not cordon_type)
-                        
-                        gpu_free = max(0, gpu_total - gpu_used)  # 避免负数
-                        
-                        total_gpus += gpu_total
-                        
-                        # 只有可调度节点的空闲 GPU 才计入统计
-                        if is_schedulable:
-                            total_free_gpus += gpu_free
-                            
-                            # 统计空闲 GPU 分布
-                            if gpu_free > 0:
-                                gpu_free_distribution[gpu_free] = gpu_free_distribution.get(gpu_free, 0) + 1
-                            
-                            if gpu_used == 0 and gpu_total > 0:
-                                free_nodes.append({
-                                    "name": node_name,
-                                    "gpu_total": gpu_total,
-                                })
-                            
-                            # 检查是否为低优空余节点（低优任务占满整节点，>=8卡）
-                            low_priority_gpu = node_low_priority_gpu.get(node_name, 0)
-                            if low_priority_gpu >= 8 and gpu_used > 0:
-                                low_priority_free_nodes.append({
-                                    "name": node_name,
-                                    "low_priority_gpu": low_priority_gpu,
-                                    "gpu_total": gpu_total,
-                                })
-                    
-                    all_results.append({
-                        "workspace_id": workspace_id,
-                        "workspace_name": ws_name,
-                        "id": lcg_id,
-                        "name": lcg_name,
-                        "gpu_type": gpu_type,
-                        "total_nodes": total_nodes,
-                        "free_nodes": len(free_nodes),
-                        "free_node_list": free_nodes,
-                        "low_priority_free_nodes": len(low_priority_free_nodes),
-                        "low_priority_free_node_list": low_priority_free_nodes,
-                        "total_gpus": total_gpus,
-                        "total_free_gpus": total_free_gpus,
-                        "gpu_free_distribution": gpu_free_distribution,
-                        "specs": specs,
+                # 统计空闲 GPU 分布
+                if gpu_free > 0:
+                    gpu_free_distribution[gpu_free] = gpu_free_distribution.get(gpu_free, 0) + 1
+                
+                if gpu_used == 0 and gpu_total > 0:
+                    free_count += 1
+                    if free_nodes is not None:
+                        free_nodes.append({
+                            "name": node_name,
+                            "gpu_total": gpu_total,
+                        })
+                
+                # 检查是否为低优空余节点（低优任务占满整节点，>=8卡）
+                low_priority_gpu = node_low_priority_gpu.get(node_name, 0)
+                if low_priority_gpu >= 8 and gpu_used > 0:
+                    low_priority_free_nodes.append({
+                        "name": node_name,
+                        "low_priority_gpu": low_priority_gpu,
+                        "gpu_total": gpu_total,
                     })
-                except QzAPIError as e:
-                    display.print_warning(f"查询 {lcg_name} 失败: {e}")
-                    continue
-        except QzAPIError as e:
-            if "401" in str(e) or "过期" in str(e):
-                display.print_error("Cookie 已过期，请重新设置: qzcli cookie -f <cookie_file>")
-                return 1
-            display.print_warning(f"查询 {ws_name} 失败: {e}")
-            continue
+        
+        all_results.append({
+            "workspace_id": workspace_id,
+            "workspace_name": ws_name,
+            "id": lcg_id,
+            "name": lcg_name,
+            "gpu_type": gpu_type,
+            "total_nodes": total_nodes,
+            "free_nodes": free_count,
+            "free_node_list": free_nodes,
+            "low_priority_free_nodes": len(low_priority_free_nodes),
+            "low_priority_free_node_list": low_priority_free_nodes,
+            "total_gpus": total_gpus,
+            "total_free_gpus": total_free_gpus,
+            "gpu_free_distribution": gpu_free_distribution,
+            "specs": specs,
+        })
     
     if not all_results:
         display.print_error("未能获取任何计算组的节点信息")
@@ -910,91 +1096,93 @@ def cmd_avail(args):
     
     display.print(f"\n[bold]空余节点汇总[/bold]\n")
     
-    # 如果指定了节点需求，过滤并推荐
-    if required_nodes:
-        # 按空闲节点数降序排序（跨工作空间），考虑低优空余
-        all_results.sort(key=lambda x: (x["free_nodes"] + x.get("low_priority_free_nodes", 0), x["free_nodes"]), reverse=True)
-        # 可用条件：空闲节点 + 低优空余节点 >= 需求
-        available = [r for r in all_results if r["free_nodes"] + r.get("low_priority_free_nodes", 0) >= required_nodes]
-        
-        if not available:
-            display.print(f"[red]没有计算组有 >= {required_nodes} 个可用节点（空闲+低优空余）[/red]\n")
-            display.print("当前各计算组节点情况：")
-            for r in all_results:
-                lp_free = r.get('low_priority_free_nodes', 0)
-                display.print(f"  [{r['workspace_name']}] {r['name']}: {r['free_nodes']} 空节点 + {lp_free} 低优空余 [{r['gpu_type']}]")
-            return 1
-        
-        display.print(f"需要 {required_nodes} 个节点，以下计算组可用：\n")
-        
-        for r in available:
-            lp_free = r.get('low_priority_free_nodes', 0)
-            total_avail = r['free_nodes'] + lp_free
-            display.print(f"[green]✓[/green] [{r['workspace_name']}] [bold]{r['name']}[/bold]  {r['free_nodes']} 空节点 + {lp_free} 低优空余 = {total_avail} 可用 [{r['gpu_type']}]")
-            display.print(f"  [cyan]{r['id']}[/cyan]")
-            # 显示空闲节点列表
-            if args.verbose and r.get('free_node_list'):
-                node_names = [n['name'] for n in r['free_node_list']]
-                display.print(f"  [dim]空闲节点: {', '.join(node_names)}[/dim]")
-            if args.verbose and r.get('low_priority_free_node_list'):
-                lp_node_names = [n['name'] for n in r['low_priority_free_node_list']]
-                display.print(f"  [dim]低优空余: {', '.join(lp_node_names)}[/dim]")
-        
-        # 导出格式
-        if args.export:
-            display.print("")
-            best = available[0]
-            display.print(f"# 推荐: [{best['workspace_name']}] {best['name']} ({best['free_nodes']} 空节点)")
-            display.print(f'WORKSPACE_ID="{best["workspace_id"]}"')
-            display.print(f'LOGIC_COMPUTE_GROUP_ID="{best["id"]}"')
-            specs = best.get("specs", {})
-            if specs:
-                spec = list(specs.values())[0]
-                display.print(f'SPEC_ID="{spec["id"]}"  # {spec.get("gpu_count", 0)}x {spec.get("gpu_type", "")}')
-    else:
-        # 按工作空间分组，组内按空闲节点数降序
-        from collections import defaultdict
-        by_workspace = defaultdict(list)
-        for r in all_results:
-            by_workspace[r['workspace_name']].append(r)
-        
-        for ws_name, results in by_workspace.items():
-            results.sort(key=lambda x: (x["free_nodes"], x.get("low_priority_free_nodes", 0)), reverse=True)
-            display.print(f"[bold]{ws_name}[/bold]")
-            display.print(f"{'  计算组':<27} {'空节点':>6} {'低优空余':>8} {'总节点':>6} {'空GPU':>8} {'GPU类型':<10}")
-            display.print("  " + "-" * 75)
-            for r in results:
-                name_display = r['name'][:23] if len(r['name']) > 23 else r['name']
-                free_gpu_str = f"{r.get('total_free_gpus', 0)}/{r.get('total_gpus', 0)}"
-                low_priority_free = r.get('low_priority_free_nodes', 0)
-                display.print(f"  {name_display:<25} {r['free_nodes']:>6} {low_priority_free:>8} {r['total_nodes']:>6} {free_gpu_str:>8} {r['gpu_type']:<10}")
-                
-                # 显示空闲 GPU 分布（-v 模式）
-                if args.verbose:
-                    dist = r.get('gpu_free_distribution', {})
-                    if dist:
-                        dist_parts = []
-                        for gpu_count in sorted(dist.keys(), reverse=True):
-                            node_count = dist[gpu_count]
-                            dist_parts.append(f"空{gpu_count}卡×{node_count}")
-                        display.print(f"    [dim]{', '.join(dist_parts)}[/dim]")
-                    if r.get('free_node_list'):
-                        node_names = [n['name'] for n in r['free_node_list']]
-                        display.print(f"    [dim]全空节点: {', '.join(node_names)}[/dim]")
-                    if r.get('low_priority_free_node_list'):
-                        lp_node_names = [n['name'] for n in r['low_priority_free_node_list']]
-                        display.print(f"    [dim]低优空余: {', '.join(lp_node_names)}[/dim]")
-            display.print("")
-        
-        # 导出格式
-        if args.export:
-            display.print("[bold]导出格式:[/bold]")
-            for r in sorted(all_results, key=lambda x: x["free_nodes"], reverse=True):
-                if r['free_nodes'] > 0:
-                    display.print(f"# [{r['workspace_name']}] {r['name']} ({r['free_nodes']} 空节点)")
-                    display.print(f'WORKSPACE_ID="{r["workspace_id"]}"')
-                    display.print(f'LOGIC_COMPUTE_GROUP_ID="{r["id"]}"')
+    export_lines = []  # 导出行在 rich 输出之后直接写入 stdout
     
+    with display.batched() as out:
+        # 如果指定了节点需求，过滤并推荐
+        if required_nodes:
+            # 可用条件：空闲节点 + 低优空余节点 >= 需求
+            available = [r for r in all_results if r["free_nodes"] + r.get("low_priority_free_nodes", 0) >= required_nodes]
+            
+            if not available:
+                out.print(f"[red]没有计算组有 >= {required_nodes} 个可用节点（空闲+低优空余）[/red]\n")
+                out.print("当前各计算组节点情况：")
+                for r in sorted(all_results, key=_avail_rank, reverse=True):
+                    lp_free = r.get('low_priority_free_nodes', 0)
+                    out.print(f"  [{r['workspace_name']}] {r['name']}: {r['free_nodes']} 空节点 + {lp_free} 低优空余 [{r['gpu_type']}]")
+                return 1
+            
+            # 只对满足条件的计算组按可用节点数降序排序（跨工作空间）
+            available.sort(key=_avail_rank, reverse=True)
+            
+            out.print(f"需要 {required_nodes} 个节点，以下计算组可用：\n")
+            
+            for r in available:
+                lp_free = r.get('low_priority_free_nodes', 0)
+                total_avail = r['free_nodes'] + lp_free
+                out.print(f"[green]✓[/green] [{r['workspace_name']}] [bold]{r['name']}[/bold]  {r['free_nodes']} 空节点 + {lp_free} 低优空余 = {total_avail} 可用 [{r['gpu_type']}]")
+                out.print(f"  [cyan]{r['id']}[/cyan]")
+                # 显示空闲节点列表
+                if args.verbose and r.get('free_node_list'):
+                    node_names = [n['name'] for n in r['free_node_list']]
+                    out.print(f"  [dim]空闲节点: {', '.join(node_names)}[/dim]")
+                if args.verbose and r.get('low_priority_free_node_list'):
+                    lp_node_names = [n['name'] for n in r['low_priority_free_node_list']]
+                    out.print(f"  [dim]低优空余: {', '.join(lp_node_names)}[/dim]")
+            
+            # 导出格式
+            if args.export:
+                out.print("")
+                best = available[0]
+                export_lines.append(f"# 推荐: [{best['workspace_name']}] {best['name']} ({best['free_nodes']} 空节点)")
+                export_lines.append(f'WORKSPACE_ID="{best["workspace_id"]}"')
+                export_lines.append(f'LOGIC_COMPUTE_GROUP_ID="{best["id"]}"')
+                spec = next(iter(best.get("specs", {}).values()), None)
+                if spec:
+                    export_lines.append(f'SPEC_ID="{spec["id"]}"  # {spec.get("gpu_count", 0)}x {spec.get("gpu_type", "")}')
+        else:
+            # 按工作空间分组，组内按空闲节点数降序
+            # all_results 按工作空间顺序连续生成，可直接 groupby，无需建字典
+            for ws_name, group in itertools.groupby(all_results, key=operator.itemgetter("workspace_name")):
+                results = sorted(group, key=lambda x: (x["free_nodes"], x.get("low_priority_free_nodes", 0)), reverse=True)
+                out.print(f"[bold]{ws_name}[/bold]")
+                out.print(f"{'  计算组':<27} {'空节点':>6} {'低优空余':>8} {'总节点':>6} {'空GPU':>8} {'GPU类型':<10}")
+                out.print("  " + "-" * 75)
+                for r in results:
+                    name_display = r['name'][:23] if len(r['name']) > 23 else r['name']
+                    free_gpu_str = f"{r.get('total_free_gpus', 0)}/{r.get('total_gpus', 0)}"
+                    low_priority_free = r.get('low_priority_free_nodes', 0)
+                    out.print(f"  {name_display:<25} {r['free_nodes']:>6} {low_priority_free:>8} {r['total_nodes']:>6} {free_gpu_str:>8} {r['gpu_type']:<10}")
+                    
+                    # 显示空闲 GPU 分布（-v 模式）
+                    if args.verbose:
+                        dist = r.get('gpu_free_distribution', {})
+                        if dist:
+                            dist_parts = []
+                            for gpu_count in sorted(dist.keys(), reverse=True):
+                                node_count = dist[gpu_count]
+                                dist_parts.append(f"空{gpu_count}卡×{node_count}")
+                            out.print(f"    [dim]{', '.join(dist_parts)}[/dim]")
+                        if r.get('free_node_list'):
+                            node_names = [n['name'] for n in r['free_node_list']]
+                            out.print(f"    [dim]全空节点: {', '.join(node_names)}[/dim]")
+                        if r.get('low_priority_free_node_list'):
+                            lp_node_names = [n['name'] for n in r['low_priority_free_node_list']]
+                            out.print(f"    [dim]低优空余: {', '.join(lp_node_names)}[/dim]")
+                out.print("")
+            
+            # 导出格式
+            if args.export:
+                out.print("[bold]导出格式:[/bold]")
+                # 先过滤再排序，只对有空节点的计算组排序
+                exportable = [r for r in all_results if r["free_nodes"] > 0]
+                exportable.sort(key=operator.itemgetter("free_nodes"), reverse=True)
+                for r in exportable:
+                    export_lines.append(f"# [{r['workspace_name']}] {r['name']} ({r['free_nodes']} 空节点)")
+                    export_lines.append(f'WORKSPACE_ID="{r["workspace_id"]}"')
+                    export_lines.append(f'LOGIC_COMPUTE_GROUP_ID="{r["id"]}"')
+    
+    _write_plain(export_lines)
     return 0
 
 
@@ -1022,7 +1210,7 @@ def cmd_usage(args):
             display.print("[dim]请先运行: qzcli res -u[/dim]")
             return 1
         workspace_ids = [(ws_id, data.get("name", "")) for ws_id, data in all_resources.items()]
-    elif workspace_input.startswith("ws-"):
+    elif _is_ws_id(workspace_input):
         ws_resources = get_workspace_resources(workspace_input)
         ws_name = ws_resources.get("name", "") if ws_resources else ""
         workspace_ids = [(workspace_input, ws_name)]
@@ -1036,27 +1224,28 @@ def cmd_usage(args):
             display.print_error(f"未找到名称为 '{workspace_input}' 的工作空间")
             return 1
     
-    from collections import defaultdict
-    
     all_stats = []
     
     for workspace_id, ws_name in workspace_ids:
         display.print(f"[dim]正在查询 {ws_name or workspace_id}...[/dim]")
-        
+    
+    # 各工作空间的任务分页和节点信息（用于发现计算组）在同一个线程池中并发请求，
+    # 之后按原顺序逐个处理
+    def run_query(workspace_id, kind):
+        if kind == "tasks":
+            return _list_all_tasks(api, workspace_id, cookie)
+        return api.list_node_dimension(workspace_id, cookie, page_size=500)
+    
+    results = _run_parallel(
+        run_query,
+        [(ws_id, kind) for ws_id, _ in workspace_ids for kind in ("tasks", "nodes")],
+    )
+    
+    for (workspace_id, ws_name), task_result, node_result in zip(workspace_ids, results[::2], results[1::2]):
+        _, tasks, error = task_result
         try:
-            # 分页获取所有任务
-            tasks = []
-            page_num = 1
-            page_size = 200
-            while True:
-                data = api.list_task_dimension(workspace_id, cookie, page_num=page_num, page_size=page_size)
-                page_tasks = data.get("task_dimensions", [])
-                total_count = data.get("total", 0)
-                tasks.extend(page_tasks)
-                
-                if len(tasks) >= total_count or not page_tasks:
-                    break
-                page_num += 1
+            if error is not None:
+                raise error
             
             if not tasks:
                 continue
@@ -1120,7 +1309,9 @@ def cmd_usage(args):
             
             # 通过 list_node_dimension 发现计算组
             try:
-                node_data = api.list_node_dimension(workspace_id, cookie, page_size=500)
+                _, node_data, node_error = node_result
+                if node_error is not None:
+                    raise node_error
                 nodes = node_data.get("node_dimensions", [])
                 
                 # 从节点信息中提取计算组
@@ -1233,6 +1424,8 @@ def cmd_usage(args):
 
 def cmd_workspace(args):
     """查看工作空间内所有运行任务"""
+    from .display import format_duration
+    
     display = get_display()
     api = get_api()
     
@@ -1246,26 +1439,24 @@ def cmd_workspace(args):
     cookie = cookie_data["cookie"]
     workspace_id = args.workspace or cookie_data.get("workspace_id", "")
     
-    # 如果没有指定 workspace，列出可用的 workspace 供选择
+    # 如果没有指定 workspace，列出已缓存的 workspace 供选择（无需请求 API）
     if not workspace_id:
-        display.print("[yellow]未设置默认工作空间，正在获取可用列表...[/yellow]\n")
-        try:
-            workspaces = api.list_workspaces(cookie)
-            if workspaces:
-                display.print("[bold]请选择一个工作空间:[/bold]\n")
-                for idx, ws in enumerate(workspaces, 1):
-                    ws_id = ws.get("id", "")
-                    ws_name = ws.get("name", "未命名")
-                    display.print(f"  [{idx}] {ws_name}")
-                    display.print(f"      [dim]{ws_id}[/dim]")
-                display.print("")
-                display.print("[dim]使用方法:[/dim]")
-                display.print("  qzcli ws -w <workspace_id>")
-                display.print("  qzcli cookie -w <workspace_id>  # 设置默认")
-            else:
-                display.print_error("未找到可访问的工作空间")
-        except QzAPIError as e:
-            display.print_error(f"获取工作空间列表失败: {e}")
+        cached = list_cached_workspaces()
+        if not cached:
+            display.print_error("未设置默认工作空间，且没有已缓存的工作空间")
+            display.print("[dim]请先运行: qzcli res -w <workspace_id> -u[/dim]")
+            return 1
+        
+        with display.batched() as out:
+            out.print("[yellow]未设置默认工作空间[/yellow]\n")
+            out.print("[bold]请选择一个工作空间:[/bold]\n")
+            for idx, ws in enumerate(cached, 1):
+                out.print(f"  [{idx}] {ws.get('name') or '未命名'}")
+                out.print(f"      [dim]{ws['id']}[/dim]")
+            out.print("")
+            out.print("[dim]使用方法:[/dim]")
+            out.print("  qzcli ws -w <workspace_id>")
+            out.print("  qzcli cookie -w <workspace_id>  # 设置默认")
         return 1
     
     # 项目过滤
@@ -1291,9 +1482,14 @@ def cmd_workspace(args):
                 display.print("工作空间内暂无运行中的任务")
             return 0
         
-        # 统计 GPU 使用
-        total_gpu = sum(t.get("gpu", {}).get("total", 0) for t in tasks)
-        avg_gpu_usage = sum(t.get("gpu", {}).get("usage_rate", 0) for t in tasks) / len(tasks) * 100 if tasks else 0
+        # 统计 GPU 使用（单次遍历同时累计卡数和利用率）
+        total_gpu = 0
+        sum_gpu_usage = 0.0
+        for t in tasks:
+            gpu_info = t.get("gpu", {})
+            total_gpu += gpu_info.get("total", 0)
+            sum_gpu_usage += gpu_info.get("usage_rate", 0)
+        avg_gpu_usage = sum_gpu_usage / len(tasks) * 100
         
         title = f"工作空间任务概览"
         if project_filter:
@@ -1303,63 +1499,57 @@ def cmd_workspace(args):
         display.print(f"\n[bold]{title}[/bold]\n")
         
         # 同步到本地任务列表
-        synced_count = 0
         if args.sync:
             store = get_store()
+            existing_ids = set(store.list_job_ids())
+            
+            # 收集本地没有的任务，最后一次性写入
+            new_jobs = {}
             for task in tasks:
                 job_id = task.get("id", "")
-                if job_id and not store.get_job(job_id):
+                if job_id and job_id not in existing_ids and job_id not in new_jobs:
                     # 创建简化的 JobRecord
-                    from .store import JobRecord
-                    job = JobRecord(
+                    project_info = task.get("project", {})
+                    new_jobs[job_id] = JobRecord(
                         job_id=job_id,
                         name=task.get("name", ""),
                         status=task.get("status", "UNKNOWN").lower(),
                         source="workspace_sync",
                         workspace_id=workspace_id,
-                        project_name=task.get("project", {}).get("name", ""),
+                        project_id=project_info.get("id", ""),
+                        project_name=project_info.get("name", ""),
                     )
-                    store.add_job(job)
-                    synced_count += 1
+            
+            synced_count = store.add_bulk(new_jobs.values())
             if synced_count > 0:
                 display.print_success(f"已同步 {synced_count} 个新任务到本地")
         
-        for idx, task in enumerate(tasks, 1):
-            name = task.get("name", "")
-            status = task.get("status", "UNKNOWN")
-            gpu_total = task.get("gpu", {}).get("total", 0)
-            gpu_usage = task.get("gpu", {}).get("usage_rate", 0) * 100
-            cpu_usage = task.get("cpu", {}).get("usage_rate", 0) * 100
-            mem_usage = task.get("memory", {}).get("usage_rate", 0) * 100
-            nodes_info = task.get("nodes_occupied", {})
-            nodes_count = nodes_info.get("count", 0)
-            nodes_list = nodes_info.get("nodes", [])
-            user_name = task.get("user", {}).get("name", "")
-            project_name = task.get("project", {}).get("name", "")
-            running_time = format_duration(task.get("running_time_ms", ""))
-            job_id = task.get("id", "")
-            
-            # 状态颜色
-            if status == "RUNNING":
-                status_icon = "[cyan]●[/cyan]"
-            elif status == "QUEUING":
-                status_icon = "[yellow]◌[/yellow]"
-            else:
-                status_icon = "[dim]?[/dim]"
-            
-            # GPU 使用率颜色
-            if gpu_usage >= 80:
-                gpu_color = "green"
-            elif gpu_usage >= 50:
-                gpu_color = "yellow"
-            else:
-                gpu_color = "red"
-            
-            display.print(f"[bold][{idx:2d}][/bold] {status_icon} {name}")
-            display.print(f"     [{gpu_color}]{gpu_total} GPU ({gpu_usage:.0f}%)[/{gpu_color}] | CPU {cpu_usage:.0f}% | MEM {mem_usage:.0f}% | {running_time} | {user_name}")
-            display.print(f"     [dim]{project_name} | {nodes_count} 节点: {', '.join(nodes_list[:3])}{'...' if len(nodes_list) > 3 else ''}[/dim]")
-            display.print(f"     [dim]{job_id}[/dim]")
-            display.print("")
+        # 所有任务行攒在一起，最后一次性交给 rich 解析输出
+        with display.batched() as out:
+            for idx, task in enumerate(tasks, 1):
+                name = task.get("name", "")
+                status = task.get("status", "UNKNOWN")
+                gpu_total = task.get("gpu", {}).get("total", 0)
+                gpu_usage = task.get("gpu", {}).get("usage_rate", 0) * 100
+                cpu_usage = task.get("cpu", {}).get("usage_rate", 0) * 100
+                mem_usage = task.get("memory", {}).get("usage_rate", 0) * 100
+                nodes_info = task.get("nodes_occupied", {})
+                nodes_count = nodes_info.get("count", 0)
+                nodes_list = nodes_info.get("nodes", [])
+                user_name = task.get("user", {}).get("name", "")
+                project_name = task.get("project", {}).get("name", "")
+                running_time = format_duration(task.get("running_time_ms", ""))
+                job_id = task.get("id", "")
+                
+                # 状态图标和 GPU 使用率颜色
+                status_icon = _WS_STATUS_ICONS.get(status, "[dim]?[/dim]")
+                gpu_color = _GPU_USAGE_COLORS[bisect.bisect(_GPU_USAGE_THRESHOLDS, gpu_usage)]
+                
+                out.print(f"[bold][{idx:2d}][/bold] {status_icon} {name}")
+                out.print(f"     [{gpu_color}]{gpu_total} GPU ({gpu_usage:.0f}%)[/{gpu_color}] | CPU {cpu_usage:.0f}% | MEM {mem_usage:.0f}% | {running_time} | {user_name}")
+                out.print(f"     [dim]{project_name} | {nodes_count} 节点: {', '.join(nodes_list[:3])}{'...' if len(nodes_list) > 3 else ''}[/dim]")
+                out.print(f"     [dim]{job_id}[/dim]")
+                out.print("")
         
         return 0
         
@@ -1428,26 +1618,15 @@ def cmd_login(args):
         return 1
 
 
-def main():
-    """主入口"""
-    parser = argparse.ArgumentParser(
-        prog="qzcli",
-        description="启智平台任务管理 CLI 工具",
-    )
-    parser.add_argument(
-        "--version", "-V",
-        action="version",
-        version=f"qzcli {__version__}"
-    )
-    
-    subparsers = parser.add_subparsers(dest="command", help="子命令")
-    
-    # init 命令
+def _add_init_parser(subparsers) -> None:
+    """添加 init 子命令"""
     init_parser = subparsers.add_parser("init", help="初始化配置")
     init_parser.add_argument("--username", "-u", help="用户名")
     init_parser.add_argument("--password", "-p", help="密码")
-    
-    # list 命令
+
+
+def _add_list_parser(subparsers) -> None:
+    """添加 list 子命令"""
     list_parser = subparsers.add_parser("list", aliases=["ls"], help="列出任务")
     list_parser.add_argument("--limit", "-n", type=int, default=20, help="显示数量限制")
     list_parser.add_argument("--status", "-s", help="按状态过滤")
@@ -1461,47 +1640,63 @@ def main():
     list_parser.add_argument("--cookie", "-c", action="store_true", help="使用 cookie 从 API 获取任务（无需本地 store）")
     list_parser.add_argument("--workspace", "-w", help="工作空间（名称或 ID，cookie 模式）")
     list_parser.add_argument("--all-ws", action="store_true", help="查询所有已缓存的工作空间（cookie 模式）")
-    
-    # status 命令
+
+
+def _add_status_parser(subparsers) -> None:
+    """添加 status 子命令"""
     status_parser = subparsers.add_parser("status", aliases=["st"], help="查看任务状态")
     status_parser.add_argument("job_id", help="任务 ID")
     status_parser.add_argument("--json", "-j", action="store_true", help="输出 JSON")
-    
-    # stop 命令
+
+
+def _add_stop_parser(subparsers) -> None:
+    """添加 stop 子命令"""
     stop_parser = subparsers.add_parser("stop", help="停止任务")
     stop_parser.add_argument("job_id", help="任务 ID")
     stop_parser.add_argument("--yes", "-y", action="store_true", help="跳过确认")
-    
-    # watch 命令
+
+
+def _add_watch_parser(subparsers) -> None:
+    """添加 watch 子命令"""
     watch_parser = subparsers.add_parser("watch", aliases=["w"], help="实时监控")
     watch_parser.add_argument("--interval", "-i", type=int, default=10, help="刷新间隔（秒）")
     watch_parser.add_argument("--limit", "-n", type=int, default=30, help="显示数量限制")
     watch_parser.add_argument("--keep-alive", "-k", action="store_true", help="所有任务完成后继续监控")
-    
-    # track 命令（供脚本调用）
+
+
+def _add_track_parser(subparsers) -> None:
+    """添加 track 子命令（供脚本调用）"""
     track_parser = subparsers.add_parser("track", help="追踪任务")
     track_parser.add_argument("job_id", help="任务 ID")
     track_parser.add_argument("--name", help="任务名称")
     track_parser.add_argument("--source", help="来源脚本")
     track_parser.add_argument("--workspace", help="工作空间 ID")
     track_parser.add_argument("--quiet", "-q", action="store_true", help="静默模式")
-    
-    # import 命令
+
+
+def _add_import_parser(subparsers) -> None:
+    """添加 import 子命令"""
     import_parser = subparsers.add_parser("import", help="从文件导入任务")
     import_parser.add_argument("file", help="包含任务 ID 的文件")
     import_parser.add_argument("--source", help="来源标记")
     import_parser.add_argument("--refresh", "-r", action="store_true", help="导入后更新状态")
-    
-    # remove 命令
+
+
+def _add_remove_parser(subparsers) -> None:
+    """添加 remove 子命令"""
     remove_parser = subparsers.add_parser("remove", aliases=["rm"], help="删除任务记录")
     remove_parser.add_argument("job_id", help="任务 ID")
     remove_parser.add_argument("--yes", "-y", action="store_true", help="跳过确认")
-    
-    # clear 命令
+
+
+def _add_clear_parser(subparsers) -> None:
+    """添加 clear 子命令"""
     clear_parser = subparsers.add_parser("clear", help="清空所有任务记录")
     clear_parser.add_argument("--yes", "-y", action="store_true", help="跳过确认")
-    
-    # cookie 命令
+
+
+def _add_cookie_parser(subparsers) -> None:
+    """添加 cookie 子命令"""
     cookie_parser = subparsers.add_parser("cookie", help="设置浏览器 cookie（用于访问内部 API）")
     cookie_parser.add_argument("cookie", nargs="?", help="浏览器 cookie 字符串")
     cookie_parser.add_argument("--file", "-f", help="从文件读取 cookie")
@@ -1509,14 +1704,18 @@ def main():
     cookie_parser.add_argument("--show", action="store_true", help="显示当前 cookie")
     cookie_parser.add_argument("--clear", action="store_true", help="清除 cookie")
     cookie_parser.add_argument("--no-test", action="store_true", help="不测试 cookie 有效性")
-    
-    # login 命令
+
+
+def _add_login_parser(subparsers) -> None:
+    """添加 login 子命令"""
     login_parser = subparsers.add_parser("login", help="通过 CAS 统一认证登录获取 cookie")
     login_parser.add_argument("--username", "-u", help="学工号")
     login_parser.add_argument("--password", "-p", help="密码")
     login_parser.add_argument("--workspace", "-w", help="默认工作空间 ID")
-    
-    # workspace 命令
+
+
+def _add_workspace_parser(subparsers) -> None:
+    """添加 workspace 子命令"""
     workspace_parser = subparsers.add_parser("workspace", aliases=["ws"], help="查看工作空间内所有运行任务")
     workspace_parser.add_argument("--workspace", "-w", help="工作空间 ID")
     workspace_parser.add_argument("--project", "-p", default="扩散", help="按项目名称过滤（默认: 扩散）")
@@ -1524,32 +1723,106 @@ def main():
     workspace_parser.add_argument("--page", type=int, default=1, help="页码")
     workspace_parser.add_argument("--size", type=int, default=100, help="每页数量（默认 100）")
     workspace_parser.add_argument("--sync", "-s", action="store_true", help="同步到本地任务列表")
-    
-    # workspaces 命令 - 从历史任务提取资源配置
+
+
+def _add_workspaces_parser(subparsers) -> None:
+    """添加 workspaces 子命令 - 从历史任务提取资源配置"""
     workspaces_parser = subparsers.add_parser("workspaces", aliases=["lsws", "res", "resources"], help="从历史任务提取资源配置（项目、计算组、规格）")
     workspaces_parser.add_argument("--workspace", "-w", help="工作空间 ID 或名称")
     workspaces_parser.add_argument("--export", "-e", action="store_true", help="输出可用于脚本的环境变量格式")
     workspaces_parser.add_argument("--update", "-u", action="store_true", help="强制从 API 更新缓存")
     workspaces_parser.add_argument("--list", "-l", action="store_true", help="列出所有已缓存的工作空间")
     workspaces_parser.add_argument("--name", help="设置工作空间名称（别名）")
-    
-    # avail 命令 - 查询空余节点
+
+
+def _add_avail_parser(subparsers) -> None:
+    """添加 avail 子命令 - 查询空余节点"""
     avail_parser = subparsers.add_parser("avail", aliases=["av"], help="查询计算组空余节点，帮助决定任务应该提交到哪里")
     avail_parser.add_argument("--workspace", "-w", help="工作空间 ID 或名称")
     avail_parser.add_argument("--group", "-g", help="计算组 ID 或名称（可选，不指定则查询所有）")
     avail_parser.add_argument("--nodes", "-n", type=int, help="需要的节点数（推荐模式：找出满足条件的计算组）")
     avail_parser.add_argument("--export", "-e", action="store_true", help="输出可用于脚本的环境变量格式")
     avail_parser.add_argument("--verbose", "-v", action="store_true", help="显示空闲节点名称列表")
-    
-    # usage 命令
+
+
+def _add_usage_parser(subparsers) -> None:
+    """添加 usage 子命令"""
     usage_parser = subparsers.add_parser("usage", help="统计工作空间的 GPU 使用分布")
     usage_parser.add_argument("--workspace", "-w", help="工作空间 ID 或名称")
     usage_parser.add_argument("--by-user", "-u", action="store_true", help="按用户统计 GPU 使用")
     usage_parser.add_argument("--by-project", "-p", action="store_true", help="按项目统计 GPU 使用")
     usage_parser.add_argument("--by-type", "-t", action="store_true", help="按任务类型统计（训练/建模/部署）")
     usage_parser.add_argument("--by-priority", "-r", action="store_true", help="按优先级统计")
+
+
+# 子命令（含别名）-> 添加该子命令解析器的函数，按帮助信息中的显示顺序排列
+_SUBPARSER_BUILDERS = {
+    "init": _add_init_parser,
+    "list": _add_list_parser,
+    "ls": _add_list_parser,
+    "status": _add_status_parser,
+    "st": _add_status_parser,
+    "stop": _add_stop_parser,
+    "watch": _add_watch_parser,
+    "w": _add_watch_parser,
+    "track": _add_track_parser,
+    "import": _add_import_parser,
+    "remove": _add_remove_parser,
+    "rm": _add_remove_parser,
+    "clear": _add_clear_parser,
+    "cookie": _add_cookie_parser,
+    "login": _add_login_parser,
+    "workspace": _add_workspace_parser,
+    "ws": _add_workspace_parser,
+    "workspaces": _add_workspaces_parser,
+    "lsws": _add_workspaces_parser,
+    "res": _add_workspaces_parser,
+    "resources": _add_workspaces_parser,
+    "avail": _add_avail_parser,
+    "av": _add_avail_parser,
+    "usage": _add_usage_parser,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(command: Optional[str] = None) -> argparse.ArgumentParser:
+    """
+    构建命令行解析器（进程内每个 command 只构建一次）
+    
+    Args:
+        command: 已知的子命令或别名时只构建该子命令的解析器；
+                 否则（--help、--version、未知命令）构建全部子命令
+    """
+    parser = argparse.ArgumentParser(
+        prog="qzcli",
+        description="启智平台任务管理 CLI 工具",
+    )
+    parser.add_argument(
+        "--version", "-V",
+        action="version",
+        version=f"qzcli {__version__}"
+    )
+    
+    subparsers = parser.add_subparsers(dest="command", help="子命令")
+    
+    if command in _SUBPARSER_BUILDERS:
+        _SUBPARSER_BUILDERS[command](subparsers)
+    else:
+        # 同一函数对应多个别名，去重后按顺序各调用一次
+        for add_parser in dict.fromkeys(_SUBPARSER_BUILDERS.values()):
+            add_parser(subparsers)
+    
+    return parser
+
+
+def main(argv: Optional[List[str]] = None):
+    """主入口"""
+    if argv is None:
+        argv = sys.argv[1:]
     
-    args = parser.parse_args()
+    # 只构建本次调用的子命令的解析器，减少启动开销
+    parser = _build_parser(argv[0] if argv else None)
+    args = parser.parse_args(argv)
     
     if not args.command:
         parser.print_help()
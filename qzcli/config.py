@@ -3,9 +3,14 @@
 """
 
 import os
-import json
+import time
+import bisect
+import tempfile
+import functools
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Iterable
+
+from ._json import loads, dumps, JSONDecodeError
 
 # 默认配置
 DEFAULT_CONFIG = {
@@ -23,24 +28,75 @@ TOKEN_CACHE_FILE = CONFIG_DIR / ".token_cache"
 COOKIE_FILE = CONFIG_DIR / ".cookie"
 
 
+def _read_json(path: Path) -> Any:
+    """读取 JSON 文件"""
+    return loads(path.read_bytes())
+
+
+def atomic_write_json(path: Path, data: Any, indent: bool = True) -> None:
+    """
+    原子地写入 JSON 文件
+    
+    先写入同目录下的唯一临时文件再 os.replace 覆盖目标文件，
+    中途中断（Ctrl+C、崩溃）不会留下写了一半的文件；失败时清理临时文件
+    """
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(dumps(data, indent=indent))
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+# 已解析的 JSON 文件缓存: path -> ((st_mtime_ns, st_size), data)
+_json_cache: Dict[Path, Tuple[Tuple[int, int], Any]] = {}
+
+
+def _read_json_cached(path: Path) -> Any:
+    """读取 JSON 文件，文件未变化（mtime 和大小相同）时复用上次的解析结果"""
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    
+    cached = _json_cache.get(path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    
+    data = _read_json(path)
+    _json_cache[path] = (key, data)
+    return data
+
+
 def ensure_config_dir() -> Path:
     """确保配置目录存在"""
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     return CONFIG_DIR
 
 
+def invalidate_config() -> None:
+    """丢弃进程内缓存的配置文件解析结果"""
+    _json_cache.pop(CONFIG_FILE, None)
+
+
+def invalidate_resources() -> None:
+    """丢弃进程内缓存的资源文件解析结果"""
+    _json_cache.pop(RESOURCES_FILE, None)
+
+
 def load_config() -> Dict[str, Any]:
-    """加载配置文件"""
+    """加载配置文件（文件未变化时复用解析结果，返回值可安全修改）"""
     ensure_config_dir()
     
-    if CONFIG_FILE.exists():
-        try:
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                config = json.load(f)
-                # 合并默认配置
-                return {**DEFAULT_CONFIG, **config}
-        except (json.JSONDecodeError, IOError):
-            pass
+    try:
+        config = _read_json_cached(CONFIG_FILE)
+        # 合并默认配置（同时得到一份副本，调用方修改不会污染缓存）
+        return {**DEFAULT_CONFIG, **config}
+    except (JSONDecodeError, IOError):
+        pass
     
     return DEFAULT_CONFIG.copy()
 
@@ -49,8 +105,8 @@ def save_config(config: Dict[str, Any]) -> None:
     """保存配置文件"""
     ensure_config_dir()
     
-    with open(CONFIG_FILE, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
+    atomic_write_json(CONFIG_FILE, config)
+    invalidate_config()
 
 
 def get_credentials() -> tuple[str, str]:
@@ -85,13 +141,11 @@ def get_token_cache() -> Optional[Dict[str, Any]]:
         return None
     
     try:
-        with open(TOKEN_CACHE_FILE, "r", encoding="utf-8") as f:
-            cache = json.load(f)
-            # 检查是否过期（预留 5 分钟缓冲）
-            import time
-            if cache.get("expires_at", 0) > time.time() + 300:
-                return cache
-    except (json.JSONDecodeError, IOError):
+        cache = _read_json(TOKEN_CACHE_FILE)
+        # 检查是否过期（预留 5 分钟缓冲）
+        if cache.get("expires_at", 0) > time.time() + 300:
+            return cache
+    except (JSONDecodeError, IOError):
         pass
     
     return None
@@ -101,14 +155,18 @@ def save_token_cache(token: str, expires_in: int) -> None:
     """保存 token 缓存"""
     ensure_config_dir()
     
-    import time
     cache = {
         "token": token,
         "expires_at": time.time() + expires_in,
     }
     
-    with open(TOKEN_CACHE_FILE, "w", encoding="utf-8") as f:
-        json.dump(cache, f)
+    atomic_write_json(TOKEN_CACHE_FILE, cache, indent=False)
+
+
+def _invalidate() -> None:
+    """清除进程内的 cookie / 资源缓存（写入文件后调用）"""
+    get_cookie.cache_clear()
+    invalidate_resources()
 
 
 def clear_token_cache() -> None:
@@ -121,26 +179,25 @@ def save_cookie(cookie: str, workspace_id: str = "") -> None:
     """保存浏览器 cookie"""
     ensure_config_dir()
     
-    import time
     data = {
         "cookie": cookie,
         "workspace_id": workspace_id,
         "saved_at": time.time(),
     }
     
-    with open(COOKIE_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2)
+    atomic_write_json(COOKIE_FILE, data)
+    _invalidate()
 
 
+@functools.lru_cache(maxsize=None)
 def get_cookie() -> Optional[Dict[str, Any]]:
     """获取保存的 cookie"""
     if not COOKIE_FILE.exists():
         return None
     
     try:
-        with open(COOKIE_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        return _read_json(COOKIE_FILE)
+    except (JSONDecodeError, IOError):
         return None
 
 
@@ -148,6 +205,7 @@ def clear_cookie() -> None:
     """清除 cookie"""
     if COOKIE_FILE.exists():
         COOKIE_FILE.unlink()
+    _invalidate()
 
 
 # 资源缓存文件
@@ -165,8 +223,6 @@ def save_resources(workspace_id: str, resources: Dict[str, Any], name: str = "")
     """
     ensure_config_dir()
     
-    import time
-    
     # 读取现有缓存
     all_resources = load_all_resources()
     
@@ -180,19 +236,15 @@ def save_resources(workspace_id: str, resources: Dict[str, Any], name: str = "")
         "updated_at": time.time(),
     }
     
-    with open(RESOURCES_FILE, "w", encoding="utf-8") as f:
-        json.dump(all_resources, f, indent=2, ensure_ascii=False)
+    atomic_write_json(RESOURCES_FILE, all_resources)
+    _invalidate()
 
 
 def load_all_resources() -> Dict[str, Any]:
-    """加载所有工作空间的资源缓存"""
-    if not RESOURCES_FILE.exists():
-        return {}
-    
+    """加载所有工作空间的资源缓存（文件未变化时复用解析结果）"""
     try:
-        with open(RESOURCES_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except (json.JSONDecodeError, IOError):
+        return _read_json_cached(RESOURCES_FILE)
+    except (JSONDecodeError, IOError):
         return {}
 
 
@@ -225,7 +277,6 @@ def set_workspace_name(workspace_id: str, name: str) -> bool:
     
     if workspace_id not in all_resources:
         # 创建一个空的工作空间条目
-        import time
         all_resources[workspace_id] = {
             "id": workspace_id,
             "name": name,
@@ -238,12 +289,68 @@ def set_workspace_name(workspace_id: str, name: str) -> bool:
         all_resources[workspace_id]["name"] = name
     
     ensure_config_dir()
-    with open(RESOURCES_FILE, "w", encoding="utf-8") as f:
-        json.dump(all_resources, f, indent=2, ensure_ascii=False)
+    atomic_write_json(RESOURCES_FILE, all_resources)
+    _invalidate()
     
     return True
 
 
+# 名称索引，随 load_all_resources() 的结果一起失效
+_name_index_cache: Dict[str, Any] = {"source": None, "workspaces": None, "resources": {}}
+
+# 名称索引（按列存放）: (精确名称 -> 值, 以 \0 连接的小写名称, 各名称在其中的起始位置, 值列表)
+_NameIndex = Tuple[Dict[str, Any], str, List[int], List[Any]]
+
+_NAME_SEP = "\0"
+
+
+def _build_name_index(items: Iterable[Tuple[str, Any]]) -> _NameIndex:
+    """由 (名称, 值) 序列构建名称索引（同名时保留第一个，小写名称只计算一次）"""
+    exact: Dict[str, Any] = {}
+    names_lc: List[str] = []
+    starts: List[int] = []
+    values: List[Any] = []
+    
+    offset = 0
+    for name, value in items:
+        exact.setdefault(name, value)
+        name_lc = name.lower()
+        names_lc.append(name_lc)
+        starts.append(offset)
+        values.append(value)
+        offset += len(name_lc) + len(_NAME_SEP)
+    
+    return exact, _NAME_SEP.join(names_lc), starts, values
+
+
+def _lookup_name(index: _NameIndex, name: str) -> Any:
+    """在名称索引中查找：精确匹配优先，其次按顺序做不区分大小写的模糊匹配"""
+    exact, haystack, starts, values = index
+    value = exact.get(name)
+    if value:
+        return value
+    
+    # 模糊匹配：在拼接后的小写名称中做一次 str.find（C 实现），
+    # 第一个命中位置所在的名称即按顺序第一个包含该子串的名称
+    name_lower = name.lower()
+    if not values or _NAME_SEP in name_lower:
+        return None
+    pos = haystack.find(name_lower)
+    if pos < 0:
+        return None
+    return values[bisect.bisect_right(starts, pos) - 1]
+
+
+def _current_name_index() -> Dict[str, Any]:
+    """返回与当前资源缓存对应的索引容器，资源文件变化后自动清空"""
+    all_resources = load_all_resources()
+    if _name_index_cache["source"] is not all_resources:
+        _name_index_cache["source"] = all_resources
+        _name_index_cache["workspaces"] = None
+        _name_index_cache["resources"] = {}
+    return _name_index_cache
+
+
 def find_workspace_by_name(name: str) -> Optional[str]:
     """
     通过名称查找工作空间 ID
@@ -254,19 +361,13 @@ def find_workspace_by_name(name: str) -> Optional[str]:
     Returns:
         工作空间 ID，或 None
     """
-    all_resources = load_all_resources()
-    
-    # 精确匹配优先
-    for ws_id, ws_data in all_resources.items():
-        if ws_data.get("name", "") == name:
-            return ws_id
-    
-    # 模糊匹配
-    for ws_id, ws_data in all_resources.items():
-        if name.lower() in ws_data.get("name", "").lower():
-            return ws_id
-    
-    return None
+    cache = _current_name_index()
+    if cache["workspaces"] is None:
+        cache["workspaces"] = _build_name_index(
+            (ws_data.get("name", ""), ws_id)
+            for ws_id, ws_data in cache["source"].items()
+        )
+    return _lookup_name(cache["workspaces"], name)
 
 
 def find_resource_by_name(
@@ -285,25 +386,21 @@ def find_resource_by_name(
     Returns:
         资源配置字典，或 None
     """
-    ws_resources = get_workspace_resources(workspace_id)
+    cache = _current_name_index()
+    ws_resources = cache["source"].get(workspace_id)
     if not ws_resources:
         return None
     
-    resources = ws_resources.get(resource_type, {})
-    
-    # 精确匹配优先
-    for res_id, res_data in resources.items():
-        res_name = res_data.get("name", "")
-        if res_name == name:
-            return res_data
-    
-    # 模糊匹配
-    for res_id, res_data in resources.items():
-        res_name = res_data.get("name", "")
-        if name.lower() in res_name.lower():
-            return res_data
-    
-    return None
+    # 每个工作空间、每种资源的索引按需构建
+    key = (workspace_id, resource_type)
+    index = cache["resources"].get(key)
+    if index is None:
+        index = _build_name_index(
+            (res_data.get("name", ""), res_data)
+            for res_data in ws_resources.get(resource_type, {}).values()
+        )
+        cache["resources"][key] = index
+    return _lookup_name(index, name)
 
 
 def list_cached_workspaces() -> List[Dict[str, Any]]:
@@ -343,8 +440,6 @@ def update_workspace_projects(workspace_id: str, projects: List[Dict[str, Any]],
     """
     ensure_config_dir()
     
-    import time
-    
     # 读取现有缓存
     all_resources = load_all_resources()
     
@@ -380,8 +475,8 @@ def update_workspace_projects(workspace_id: str, projects: List[Dict[str, Any]],
     ws_data["projects"] = existing_projects
     ws_data["updated_at"] = time.time()
     
-    with open(RESOURCES_FILE, "w", encoding="utf-8") as f:
-        json.dump(all_resources, f, indent=2, ensure_ascii=False)
+    atomic_write_json(RESOURCES_FILE, all_resources)
+    _invalidate()
     
     return new_count
 
@@ -400,8 +495,6 @@ def update_workspace_compute_groups(workspace_id: str, compute_groups: List[Dict
     """
     ensure_config_dir()
     
-    import time
-    
     # 读取现有缓存
     all_resources = load_all_resources()
     
@@ -437,7 +530,7 @@ def update_workspace_compute_groups(workspace_id: str, compute_groups: List[Dict
     ws_data["compute_groups"] = existing_groups
     ws_data["updated_at"] = time.time()
     
-    with open(RESOURCES_FILE, "w", encoding="utf-8") as f:
-        json.dump(all_resources, f, indent=2, ensure_ascii=False)
+    atomic_write_json(RESOURCES_FILE, all_resources)
+    _invalidate()
     
     return new_count
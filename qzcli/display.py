@@ -2,8 +2,10 @@
 显示渲染模块 - 使用 rich 库
 """
 
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator
 from datetime import datetime
+from contextlib import contextmanager
+from functools import lru_cache
 
 try:
     from rich.console import Console
@@ -77,25 +79,28 @@ def format_time_ago(iso_time: str) -> str:
         return "-"
 
 
+@lru_cache(maxsize=2048)
+def _format_seconds(seconds: int) -> str:
+    """按秒格式化运行时长（结果缓存，同一时长只格式化一次）"""
+    if seconds < 60:
+        return f"{seconds}秒"
+    elif seconds < 3600:
+        minutes = seconds // 60
+        secs = seconds % 60
+        return f"{minutes}分{secs}秒"
+    else:
+        hours = seconds // 3600
+        minutes = (seconds % 3600) // 60
+        return f"{hours}小时{minutes}分"
+
+
 def format_duration(ms_str: str) -> str:
     """格式化运行时长"""
     if not ms_str:
         return "-"
     
     try:
-        ms = int(ms_str)
-        seconds = ms // 1000
-        
-        if seconds < 60:
-            return f"{seconds}秒"
-        elif seconds < 3600:
-            minutes = seconds // 60
-            secs = seconds % 60
-            return f"{minutes}分{secs}秒"
-        else:
-            hours = seconds // 3600
-            minutes = (seconds % 3600) // 60
-            return f"{hours}小时{minutes}分"
+        return _format_seconds(int(ms_str) // 1000)
     except (ValueError, TypeError):
         return "-"
 
@@ -107,6 +112,17 @@ def truncate_string(s: str, max_len: int) -> str:
     return s[:max_len - 3] + "..."
 
 
+class OutputBuffer:
+    """输出缓冲区，收集多行文本后一次性打印"""
+    
+    def __init__(self):
+        self.lines: List[str] = []
+    
+    def print(self, text: str = "") -> None:
+        """追加一行"""
+        self.lines.append(text)
+
+
 class Display:
     """显示渲染器"""
     
@@ -123,6 +139,16 @@ class Display:
         else:
             print(*args)
     
+    @contextmanager
+    def batched(self) -> Iterator[OutputBuffer]:
+        """批量输出：with 块内收集的多行在退出时合并为一次 print"""
+        buffer = OutputBuffer()
+        try:
+            yield buffer
+        finally:
+            if buffer.lines:
+                self.print("\n".join(buffer.lines))
+    
     def print_error(self, message: str):
         """打印错误"""
         if self.console:
@@ -2,14 +2,19 @@
 任务存储模块 - JSON 文件存储
 """
 
-import json
 import time
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Iterable
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
+from functools import cached_property
 
-from .config import JOBS_FILE, ensure_config_dir
+from ._json import loads, JSONDecodeError
+from .config import JOBS_FILE, ensure_config_dir, atomic_write_json
+
+
+# 终态任务状态，不再需要刷新
+TERMINAL_STATUSES = frozenset({"job_succeeded", "job_failed", "job_stopped"})
 
 
 @dataclass
@@ -39,6 +44,11 @@ class JobRecord:
     gpu_type: str = ""  # 如 "H200"
     project_name: str = ""  # 如 "CI-扩散音视频生成"
     
+    @cached_property
+    def status_lower(self) -> str:
+        """小写状态（缓存，避免过滤时重复 lower()）"""
+        return self.status.lower()
+    
     def to_dict(self) -> Dict[str, Any]:
         return asdict(self)
     
@@ -126,14 +136,13 @@ class JobStore:
         
         if self.store_file.exists():
             try:
-                with open(self.store_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    jobs_data = data.get("jobs", {})
-                    self._jobs = {
-                        k: JobRecord.from_dict(v)
-                        for k, v in jobs_data.items()
-                    }
-            except (json.JSONDecodeError, IOError):
+                data = loads(self.store_file.read_bytes())
+                jobs_data = data.get("jobs", {})
+                self._jobs = {
+                    k: JobRecord.from_dict(v)
+                    for k, v in jobs_data.items()
+                }
+            except (JSONDecodeError, IOError):
                 self._jobs = {}
         
         self._loaded = True
@@ -148,8 +157,7 @@ class JobStore:
             "jobs": {k: v.to_dict() for k, v in self._jobs.items()}
         }
         
-        with open(self.store_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        atomic_write_json(self.store_file, data)
     
     def add(self, job: JobRecord) -> None:
         """添加任务"""
@@ -157,6 +165,19 @@ class JobStore:
         self._jobs[job.job_id] = job
         self._save()
     
+    def add_bulk(self, jobs: Iterable[JobRecord]) -> int:
+        """批量添加任务，只写一次文件，返回添加的数量"""
+        self._ensure_loaded()
+        
+        count = 0
+        for job in jobs:
+            self._jobs[job.job_id] = job
+            count += 1
+        
+        if count > 0:
+            self._save()
+        return count
+    
     def update(self, job_id: str, **kwargs) -> Optional[JobRecord]:
         """更新任务"""
         self._ensure_loaded()
@@ -169,6 +190,9 @@ class JobStore:
             if hasattr(job, key):
                 setattr(job, key, value)
         
+        # 状态可能已变化，丢弃缓存的小写状态
+        job.__dict__.pop("status_lower", None)
+        
         job.updated_at = datetime.now().isoformat()
         self._save()
         return job
@@ -176,7 +200,34 @@ class JobStore:
     def update_from_api(self, job_id: str, api_data: Dict[str, Any]) -> Optional[JobRecord]:
         """从 API 响应更新任务"""
         self._ensure_loaded()
+        job = self._apply_api_data(job_id, api_data)
+        self._save()
+        return job
+    
+    def update_from_api_bulk(self, results: Dict[str, Dict[str, Any]]) -> Dict[str, JobRecord]:
+        """
+        批量从 API 响应更新任务，只写一次文件
+        
+        Args:
+            results: job_id -> API 响应（包含 "error" 的条目会被跳过）
+            
+        Returns:
+            job_id -> 更新后的任务记录
+        """
+        self._ensure_loaded()
         
+        updated = {
+            job_id: self._apply_api_data(job_id, api_data)
+            for job_id, api_data in results.items()
+            if "error" not in api_data
+        }
+        
+        if updated:
+            self._save()
+        return updated
+    
+    def _apply_api_data(self, job_id: str, api_data: Dict[str, Any]) -> JobRecord:
+        """用 API 响应更新内存中的记录（不保存）"""
         if job_id not in self._jobs:
             # 如果不存在则创建
             job = JobRecord.from_api_response(api_data)
@@ -190,7 +241,6 @@ class JobStore:
             new_job.metadata = job.metadata
             self._jobs[job_id] = new_job
         
-        self._save()
         return self._jobs[job_id]
     
     def get(self, job_id: str) -> Optional[JobRecord]:
@@ -224,6 +274,29 @@ class JobStore:
         
         return jobs
     
+    def list_with_counts(
+        self,
+        limit: Optional[int] = None,
+        terminal_statuses: Iterable[str] = TERMINAL_STATUSES,
+    ) -> Tuple[List[JobRecord], int]:
+        """
+        列出任务，同时统计其中的非终态任务数
+        
+        Returns:
+            (按创建时间倒序的任务列表, 列表中非终态任务数)
+        """
+        jobs = self.list(limit=limit)
+        active_count = sum(1 for j in jobs if j.status not in terminal_statuses)
+        return jobs, active_count
+    
+    def list_active_ids(self, terminal_statuses: Iterable[str] = TERMINAL_STATUSES) -> List[str]:
+        """列出所有非终态任务 ID（不排序）"""
+        self._ensure_loaded()
+        return [
+            job_id for job_id, job in self._jobs.items()
+            if job.status not in terminal_statuses
+        ]
+    
     def list_job_ids(self) -> List[str]:
         """列出所有任务 ID"""
         self._ensure_loaded()
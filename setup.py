@@ -16,6 +16,9 @@ setup(
         "requests>=2.28",
         "rich>=13.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.6"],
+    },
     entry_points={
         "console_scripts": [
             "qzcli=qzcli.cli:main",